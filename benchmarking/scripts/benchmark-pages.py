@@ -19,15 +19,26 @@ Usage in CI:
         --integration-results benchmarking/benchmark-integration-wrk/target/benchmark-results/gh-pages-ready \\
         --previous-pages-dir previous-pages/OAuth-Sheriff/benchmarks \\
         --output-dir gh-pages \\
-        --commit-sha "$COMMIT_SHA"
+        --commit-sha "$COMMIT_SHA" \\
+        --link-mode hardlink
 """
 
+from __future__ import annotations
+
 import argparse
-import json
+import heapq
+import os
 import shutil
+import stat
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Modules only needed by assemble (json, datetime, concurrent.futures) are imported where
+# they are used, keeping prepare-history's startup lean.
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
 
 # Badge files produced by each benchmark type and their names in the root badges/ directory.
 _BADGE_MAPPING = {
@@ -45,31 +56,232 @@ _BADGE_MAPPING = {
 
 _BENCHMARK_TYPES = ("micro", "integration")
 _DEFAULT_MAX_HISTORY = 10
+_LINK_MODES = ("copy", "hardlink", "symlink")
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# os.sendfile() only accepts regular file descriptors as output on Linux.
+_USE_SENDFILE = sys.platform.startswith("linux")
+
+
+def _is_same_file(path: str, st: os.stat_result) -> bool:
+    """Whether path exists and (after following symlinks) is the file described by st."""
+    try:
+        return os.path.samestat(os.stat(path), st)
+    except FileNotFoundError:
+        return False
+
+
+def _copy_file(src: str, dst: str, st: os.stat_result) -> None:
+    """Copy file contents, permission bits and timestamps (like shutil.copy2) from src to dst.
+
+    Uses the caller's cached stat of src instead of stat'ing it again.
+    """
+    mode = stat.S_IMODE(st.st_mode)
+    if _USE_SENDFILE:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, mode)
+            try:
+                # dst may be a hardlink to src left by an earlier --link-mode hardlink run;
+                # truncating it would destroy the source.
+                if os.path.samestat(os.fstat(dst_fd), st):
+                    return
+                os.ftruncate(dst_fd, 0)
+                os.fchmod(dst_fd, mode)
+                offset = 0
+                while offset < st.st_size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, st.st_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    else:
+        if _is_same_file(dst, st):
+            return
+        shutil.copyfile(src, dst)
+        os.chmod(dst, mode)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _dumps_json(obj: object) -> bytes:
+    """Serialize obj as 2-space indented JSON with a trailing newline."""
+    try:
+        import orjson
+    except ImportError:  # optional speedup; CI images without it use the stdlib encoder
+        import json
+        return (json.dumps(obj, indent=2) + "\n").encode("ascii")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
+def _link_file(src: str, dst: str, st: os.stat_result) -> None:
+    """Hardlink src to dst, replacing an existing dst; falls back to copying if linking fails.
+
+    An existing dst that already is src (a hardlink from an earlier run) is left alone.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        if _is_same_file(dst, st):
+            return
+        os.unlink(dst)
+    except OSError:
+        # e.g. EXDEV across filesystems
+        _copy_file(src, dst, st)
+        return
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file(src, dst, st)
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """Write payload to path with raw os.write calls (no text layer, no fsync)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
-def _copy_json_files(src_dir: Path, dst_dir: Path, *, skip_existing: bool = False) -> int:
-    """Copy all .json files from src to dst. Returns count of files copied."""
-    dst_dir.mkdir(parents=True, exist_ok=True)
+def _scandir_sorted(path: str | Path) -> list[os.DirEntry]:
+    """List directory entries, ordered by inode number on POSIX to keep inode lookups near-sequential."""
+    with os.scandir(path) as it:
+        entries = list(it)
+    if os.name == "posix":
+        entries.sort(key=os.DirEntry.inode)
+    return entries
+
+
+def _copy_json_files(src_dir: Path, dst_dir: Path) -> int:
+    """Copy all .json files from src to dst. Returns count of files copied.
+
+    Files already present in dst with identical size and mtime are left untouched.
+    """
+    dst_str = os.fspath(dst_dir)
+    os.makedirs(dst_str, exist_ok=True)
+    with os.scandir(dst_str) as it:
+        existing = {entry.name: entry for entry in it}
     copied = 0
-    for f in src_dir.glob("*.json"):
-        dst = dst_dir / f.name
-        if skip_existing and dst.exists():
+    for entry in _scandir_sorted(os.fspath(src_dir)):
+        if not entry.name.endswith(".json") or not entry.is_file():
             continue
-        shutil.copy2(f, dst)
+        st = entry.stat()
+        dst_entry = existing.get(entry.name)
+        if dst_entry is not None:
+            dst_st = dst_entry.stat()
+            if dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+                continue
+        _copy_file(entry.path, os.path.join(dst_str, entry.name), st)
         copied += 1
     return copied
 
 
-def _enforce_retention(history_dir: Path, max_files: int) -> int:
-    """Keep only the newest max_files JSON files (sorted by name descending). Returns count removed."""
-    if not history_dir.is_dir():
-        return 0
-    files = sorted(history_dir.glob("*.json"), reverse=True)
+def _json_entries(directory: Path | None) -> dict[str, os.DirEntry]:
+    """Map name to DirEntry for the .json files in directory; empty if it does not exist."""
+    if directory is None or not directory.is_dir():
+        return {}
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it if entry.name.endswith(".json") and entry.is_file()}
+
+
+def _fast_copytree(src: Path, dst: Path, executor: Executor,
+                   copy_fn: Callable[[str, str, os.stat_result], None] = _copy_file) -> None:
+    """Recursively copy src into dst (existing files are overwritten), stat'ing each entry once.
+
+    Directories are walked on the calling thread (files of a directory before its
+    subdirectories); the file copies run on executor and are awaited before returning.
+    copy_fn(src, dst, stat) transfers a single file, e.g. _link_file to hardlink the tree;
+    symlinked files are always copied by content.
+    """
+    pending = []
+    dirs = [(os.fspath(src), os.fspath(dst))]
+    while dirs:
+        src_dir, dst_dir = dirs.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        subdirs = []
+        for entry in _scandir_sorted(src_dir):
+            if entry.is_dir():
+                subdirs.append((entry.path, os.path.join(dst_dir, entry.name)))
+            else:
+                target = os.path.join(dst_dir, entry.name)
+                # os.link() would link a symlink itself, not its target; copy the contents
+                # instead, as copytree does.
+                fn = _copy_file if entry.is_symlink() else copy_fn
+                pending.append(executor.submit(fn, entry.path, target, entry.stat()))
+        dirs.extend(reversed(subdirs))
+    for future in pending:
+        future.result()
+
+
+def _merge_and_retain(prev_history: Path | None, cur_history: Path,
+                      max_files: int) -> tuple[int, int, bool]:
+    """Merge previous history into cur_history and keep only the newest max_files JSON files.
+
+    Both directories are scanned once. Of the union of file names, the max_files largest
+    (newest) are kept: kept files missing from cur_history are copied from prev_history,
+    files already in cur_history take precedence, and the rest of cur_history is removed.
+    Returns (merged, removed, up_to_date), where up_to_date means every previous file was
+    already present in cur_history.
+    """
+    previous = _json_entries(prev_history)
+    current = _json_entries(cur_history)
+    keep = set(heapq.nlargest(max_files, previous.keys() | current.keys()))
+
+    to_copy = [entry for name, entry in previous.items() if name in keep and name not in current]
+    if to_copy:
+        cur_str = os.fspath(cur_history)
+        os.makedirs(cur_str, exist_ok=True)
+        if os.name == "posix":
+            to_copy.sort(key=os.DirEntry.inode)
+        for entry in to_copy:
+            _copy_file(entry.path, os.path.join(cur_str, entry.name), entry.stat())
+
     removed = 0
-    for old_file in files[max_files:]:
-        old_file.unlink()
-        removed += 1
-    return removed
+    for name, entry in current.items():
+        if name not in keep:
+            os.unlink(entry.path)
+            removed += 1
+    return len(to_copy), removed, previous.keys() <= current.keys()
+
+
+def _deploy_module(name: str, results_dir: Path, output_dir: Path, badges_dir: Path,
+                   executor: Executor, link_mode: str) -> list[str]:
+    """Copy one module's artifacts into output_dir and promote its badges. Returns log lines."""
+    if not results_dir.is_dir():
+        return [f"Warning: {name} results not found at {results_dir}, skipping"]
+
+    # Copy (or link) full module output into type subdirectory. A symlink left by an earlier
+    # --link-mode symlink run is replaced, never walked into: it points at the sources.
+    target = output_dir / name
+    if target.is_symlink():
+        target.unlink()
+    if link_mode == "symlink":
+        os.symlink(results_dir.resolve(), target, target_is_directory=True)
+        log = [f"Symlinked {name} benchmark artifacts to {target}"]
+    elif link_mode == "hardlink":
+        _fast_copytree(results_dir, target, executor, copy_fn=_link_file)
+        log = [f"Hardlinked {name} benchmark artifacts to {target}"]
+    else:
+        _fast_copytree(results_dir, target, executor)
+        log = [f"Copied {name} benchmark artifacts to {target}"]
+
+    # Promote badges to root badges/ directory with mapped names
+    mapping = _BADGE_MAPPING.get(name)
+    module_badges = results_dir / "badges"
+    if mapping and module_badges.is_dir():
+        badges_dir_str = os.fspath(badges_dir)
+        with os.scandir(module_badges) as it:
+            for entry in it:
+                dst_name = mapping.get(entry.name)
+                if dst_name is not None and entry.is_file():
+                    _copy_file(entry.path, os.path.join(badges_dir_str, dst_name), entry.stat())
+    return log
 
 
 def prepare_history(args: argparse.Namespace) -> None:
@@ -96,6 +308,9 @@ def assemble(args: argparse.Namespace) -> None:
     HistoricalDataManager.archiveCurrentRun() during the benchmark verify phase.
     This function only merges previously deployed history and enforces retention.
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timezone
+
     now = datetime.now(timezone.utc)
     output_dir = Path(args.output_dir)
     previous_dir = Path(args.previous_pages_dir) if args.previous_pages_dir else None
@@ -114,56 +329,59 @@ def assemble(args: argparse.Namespace) -> None:
               file=sys.stderr)
         sys.exit(1)
 
-    # 1. Merge previous history (skip files that already exist to avoid overwriting current run)
-    if previous_dir and previous_dir.is_dir():
-        for name, results_dir in modules:
-            prev_history = previous_dir / name / "history"
-            if not prev_history.is_dir():
-                continue
-            history_dir = results_dir / "history"
-            count = _copy_json_files(prev_history, history_dir, skip_existing=True)
-            print(f"Merged {count} previous {name} history files")
+    if args.link_mode == "symlink":
+        for name, _ in modules:
+            target = output_dir / name
+            if target.exists() and not target.is_symlink():
+                print(f"Error: {target} already exists and is not a symlink; "
+                      "--link-mode symlink needs a fresh output directory", file=sys.stderr)
+                sys.exit(1)
 
-    # 2. Enforce retention policy per module
+    # 1. Merge previous history (current run files win) and enforce retention in one pass
     for name, results_dir in modules:
-        removed = _enforce_retention(results_dir / "history", max_history)
+        prev_history = previous_dir / name / "history" if previous_dir else None
+        merged, removed, up_to_date = _merge_and_retain(prev_history, results_dir / "history",
+                                                        max_history)
+        if prev_history and prev_history.is_dir():
+            if up_to_date:
+                print(f"Previous {name} history already up to date")
+            else:
+                print(f"Merged {merged} previous {name} history files")
         if removed:
             print(f"Removed {removed} old {name} history files (retention: {max_history})")
 
-    # 3. Combine into output directory
+    # 2. Combine into output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     badges_dir = output_dir / "badges"
     badges_dir.mkdir(exist_ok=True)
 
-    for name, results_dir in modules:
-        if not results_dir.is_dir():
-            print(f"Warning: {name} results not found at {results_dir}, skipping")
-            continue
-
-        # Copy full module output into type subdirectory
-        shutil.copytree(results_dir, output_dir / name, dirs_exist_ok=True)
-        print(f"Copied {name} benchmark artifacts to {output_dir / name}")
-
-        # Promote badges to root badges/ directory with mapped names
-        module_badges = results_dir / "badges"
-        if module_badges.is_dir() and name in _BADGE_MAPPING:
-            for src_name, dst_name in _BADGE_MAPPING[name].items():
-                src = module_badges / src_name
-                if src.is_file():
-                    shutil.copy2(src, badges_dir / dst_name)
-
-    # 4. Write deployment metadata
+    # Modules target independent subtrees, so deploy them concurrently; log lines are
+    # buffered per module and printed in module order.
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as copy_pool, \
+            ThreadPoolExecutor(max_workers=len(modules)) as module_pool:
+        futures = [
+            module_pool.submit(_deploy_module, name, results_dir, output_dir, badges_dir, copy_pool,
+                               args.link_mode)
+            for name, results_dir in modules
+        ]
+        for future in futures:
+            for line in future.result():
+                print(line)
+
+    # 3. Write deployment metadata
     metadata = {
-        "timestamp": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": f"{now.year:04d}-{now.month:02d}-{now.day:02d}T"
+                     f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}Z",
         "commit": commit_sha,
     }
-    (output_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n")
+    _write_file(output_dir / "metadata.json", _dumps_json(metadata))
 
     # Summary
     print(f"\nAssembled deployment artifacts in {output_dir}/")
-    for entry in sorted(output_dir.iterdir()):
-        kind = "dir" if entry.is_dir() else "file"
-        print(f"  {entry.name}/ " if entry.is_dir() else f"  {entry.name}")
+    with os.scandir(output_dir) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        print(f"  {entry.name}/" if entry.is_dir() else f"  {entry.name}")
 
 
 def main() -> None:
@@ -185,6 +403,7 @@ def main() -> None:
         "--output-dir", required=True,
         help="Output directory for history files (passed to Maven as benchmark.history.dir parent)",
     )
+    prep.set_defaults(func=prepare_history)
 
     # assemble
     asm = subparsers.add_parser(
@@ -215,14 +434,17 @@ def main() -> None:
         "--max-history", type=int, default=_DEFAULT_MAX_HISTORY,
         help=f"Maximum number of history entries to retain (default: {_DEFAULT_MAX_HISTORY})",
     )
+    asm.add_argument(
+        "--link-mode", choices=_LINK_MODES, default="copy",
+        help="How module artifacts are placed in the output directory: copy (default), "
+             "hardlink (per file, copying where linking fails, e.g. across filesystems) or "
+             "symlink (whole module directory; only for consumers that follow symlinks, "
+             "cp -r and git add do not)",
+    )
+    asm.set_defaults(func=assemble)
 
     args = parser.parse_args()
-
-    command_handlers = {
-        "prepare-history": prepare_history,
-        "assemble": assemble,
-    }
-    command_handlers[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""Tests for benchmark-pages.py.
+
+Run with: python3 -m pytest benchmarking/scripts
+"""
+
+import errno
+import importlib.util
+import itertools
+import os
+import re
+import stat
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).with_name("benchmark-pages.py")
+_spec = importlib.util.spec_from_file_location("benchmark_pages", _SCRIPT)
+benchmark_pages = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark_pages)
+
+_MODULE_FILES = {
+    "index.html": "<html/>\n",
+    "data/sub/deep.json": '{"deep": true}\n',
+    "badges/trend-badge.json": '{"badge": "trend"}\n',
+    "history/2026-01-10.json": '{"run": 10}\n',
+}
+
+
+def _write_tree(root: Path, files: dict[str, str]) -> None:
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _read_tree(root: Path) -> dict[str, str]:
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+def _run(monkeypatch, *argv: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["benchmark-pages.py", *argv])
+    benchmark_pages.main()
+
+
+def _assemble(monkeypatch, tmp_path: Path, link_mode: str, *extra: str) -> None:
+    _run(monkeypatch, "assemble",
+         "--micro-results", str(tmp_path / "micro"),
+         "--output-dir", str(tmp_path / "out"),
+         "--commit-sha", "abc123",
+         "--link-mode", link_mode, *extra)
+
+
+@pytest.fixture
+def results(tmp_path: Path) -> Path:
+    _write_tree(tmp_path / "micro", _MODULE_FILES)
+    return tmp_path / "micro"
+
+
+@pytest.mark.parametrize("link_mode", benchmark_pages._LINK_MODES)
+def test_assemble_places_module_artifacts(monkeypatch, tmp_path, results, link_mode):
+    _assemble(monkeypatch, tmp_path, link_mode)
+
+    out = tmp_path / "out"
+    assert _read_tree(out / "micro") == _MODULE_FILES
+    badge = (out / "badges" / "trend-badge.json").read_text()
+    assert badge == _MODULE_FILES["badges/trend-badge.json"]
+    assert (out / "metadata.json").is_file()
+
+
+_METADATA_PATTERN = re.compile(
+    rb'\{\n  "timestamp": "(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)",\n  "commit": "abc123"\n\}\n')
+
+
+@pytest.mark.parametrize("encoder", ["json", "orjson"])
+def test_metadata_json_bytes(monkeypatch, tmp_path, results, encoder):
+    if encoder == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)  # force the stdlib encoder
+
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    _assemble(monkeypatch, tmp_path, "copy")
+    after = datetime.now(timezone.utc)
+
+    match = _METADATA_PATTERN.fullmatch((tmp_path / "out" / "metadata.json").read_bytes())
+    assert match
+    timestamp = datetime.strptime(match.group(1).decode(), "%Y-%m-%dT%H:%M:%SZ")
+    assert before <= timestamp.replace(tzinfo=timezone.utc) <= after
+
+
+@pytest.mark.parametrize("link_mode", benchmark_pages._LINK_MODES)
+def test_symlinked_file_is_placed_with_target_contents(monkeypatch, tmp_path, results, link_mode):
+    _write_tree(tmp_path / "shared", {"s.json": '{"shared": true}\n'})
+    (results / "data" / "s.json").symlink_to(Path("..", "..", "shared", "s.json"))
+
+    _assemble(monkeypatch, tmp_path, link_mode)
+
+    placed = tmp_path / "out" / "micro" / "data" / "s.json"
+    assert placed.is_file()
+    assert placed.read_text() == '{"shared": true}\n'
+    if link_mode != "symlink":
+        # Only symlink mode links the module directory itself; its entries stay as they are.
+        assert not placed.is_symlink()
+
+
+@pytest.mark.parametrize("first, second", [
+    pair for pair in itertools.product(benchmark_pages._LINK_MODES, repeat=2)
+    if pair[1] != "symlink" or pair[0] == "symlink"
+])
+def test_rerun_with_other_link_mode_keeps_sources(monkeypatch, tmp_path, results, first, second):
+    _assemble(monkeypatch, tmp_path, first)
+    _assemble(monkeypatch, tmp_path, second)
+
+    assert _read_tree(results) == _MODULE_FILES
+    assert _read_tree(tmp_path / "out" / "micro") == _MODULE_FILES
+    assert (tmp_path / "out" / "micro").is_symlink() == (second == "symlink")
+
+
+@pytest.mark.parametrize("first", ["copy", "hardlink"])
+def test_symlink_over_existing_directory_is_refused(monkeypatch, tmp_path, results, capsys, first):
+    _assemble(monkeypatch, tmp_path, first)
+
+    with pytest.raises(SystemExit) as exc:
+        _assemble(monkeypatch, tmp_path, "symlink")
+
+    assert exc.value.code == 1
+    assert "Error:" in capsys.readouterr().err
+    assert _read_tree(results) == _MODULE_FILES
+
+
+def test_copy_after_hardlink_without_sendfile(monkeypatch, tmp_path, results):
+    monkeypatch.setattr(benchmark_pages, "_USE_SENDFILE", False)
+    _assemble(monkeypatch, tmp_path, "hardlink")
+    _assemble(monkeypatch, tmp_path, "copy")
+
+    assert _read_tree(results) == _MODULE_FILES
+    assert _read_tree(tmp_path / "out" / "micro") == _MODULE_FILES
+
+
+def test_hardlink_rerun_falls_back_to_copy_across_filesystems(monkeypatch, tmp_path, results):
+    _assemble(monkeypatch, tmp_path, "copy")
+
+    real_link = os.link
+
+    def cross_device_link(src, dst):
+        if os.path.lexists(dst):
+            real_link(src, dst)  # raises FileExistsError like link(2) does before EXDEV
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", cross_device_link)
+    _assemble(monkeypatch, tmp_path, "hardlink")
+
+    assert _read_tree(results) == _MODULE_FILES
+    assert _read_tree(tmp_path / "out" / "micro") == _MODULE_FILES
+
+
+def test_copy_applies_mode_to_existing_destination(tmp_path):
+    src = tmp_path / "src.json"
+    dst = tmp_path / "dst.json"
+    src.write_text("new")
+    dst.write_text("old")
+    src.chmod(0o640)
+    dst.chmod(0o600)
+
+    benchmark_pages._copy_file(str(src), str(dst), src.stat())
+
+    assert dst.read_text() == "new"
+    assert stat.S_IMODE(dst.stat().st_mode) == 0o640
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_merge_and_retain_keeps_newest(tmp_path):
+    _write_tree(tmp_path / "prev", {f"2026-01-0{i}.json": "{}" for i in range(1, 6)})
+    _write_tree(tmp_path / "cur", {"2026-01-03.json": '{"current": true}', "2026-01-06.json": "{}"})
+
+    merged, removed, up_to_date = benchmark_pages._merge_and_retain(
+        tmp_path / "prev", tmp_path / "cur", 3)
+
+    assert (merged, removed, up_to_date) == (2, 1, False)
+    assert sorted(_read_tree(tmp_path / "cur")) == [
+        "2026-01-04.json", "2026-01-05.json", "2026-01-06.json",
+    ]
+
+
+def test_merge_and_retain_prefers_current_run(tmp_path):
+    _write_tree(tmp_path / "prev", {"2026-01-01.json": '{"previous": true}'})
+    _write_tree(tmp_path / "cur", {"2026-01-01.json": '{"current": true}'})
+
+    result = benchmark_pages._merge_and_retain(tmp_path / "prev", tmp_path / "cur", 3)
+
+    assert result == (0, 0, True)
+    assert (tmp_path / "cur" / "2026-01-01.json").read_text() == '{"current": true}'
+
+
+def test_merge_reports_up_to_date_only_when_nothing_missing(monkeypatch, tmp_path, results, capsys):
+    previous = tmp_path / "previous"
+    _write_tree(previous / "micro" / "history", {"2026-01-01.json": "{}"})
+    history_args = ("--previous-pages-dir", str(previous), "--max-history", "1")
+
+    _assemble(monkeypatch, tmp_path, "copy", *history_args)
+    out = capsys.readouterr().out
+    assert "Merged 0 previous micro history files" in out
+    assert "already up to date" not in out
+
+    _write_tree(previous / "micro" / "history", {"2026-01-10.json": "{}"})
+    (previous / "micro" / "history" / "2026-01-01.json").unlink()
+    _assemble(monkeypatch, tmp_path, "copy", *history_args)
+    assert "Previous micro history already up to date" in capsys.readouterr().out